@@ -1,7 +1,12 @@
+import io
 import logging
+import os
 import shutil
+import sys
+import tempfile
+import time
 
-from contextlib import suppress
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Optional, Union
 
@@ -17,26 +22,81 @@ from gretel_trainer.relational.core import MultiTableException
 logger = logging.getLogger(__name__)
 
 MAX_PROJECT_ARTIFACTS = 10_000
+COPY_BUFFER_SIZE = 1 << 20
+ARTIFACT_COUNT_CACHE_TTL_SECONDS = 5.0
+
+# os.sendfile exists on macOS/BSD too, but there the destination must be a
+# socket; only Linux supports file-to-file copies (same gate as stdlib shutil).
+_USE_SENDFILE = hasattr(os, "sendfile") and sys.platform.startswith("linux")
+
+
+def _copy_stream(src: Any, dest: Any) -> None:
+    # When both ends are plain OS files (hybrid/local artifacts), os.sendfile
+    # copies in-kernel and skips userspace buffering entirely. The type check
+    # matters: wrappers like gzip streams expose a fileno for the *compressed*
+    # file while reads return decompressed bytes, so anything that isn't a
+    # raw file object falls back to a buffered copy.
+    if (
+        _USE_SENDFILE
+        and isinstance(src, (io.FileIO, io.BufferedReader))
+        and isinstance(dest, (io.FileIO, io.BufferedWriter))
+    ):
+        try:
+            src_fd = src.fileno()
+            dest_fd = dest.fileno()
+        except (OSError, io.UnsupportedOperation):
+            pass
+        else:
+            dest.flush()
+            offset = src.tell()
+            size = os.fstat(src_fd).st_size
+            while offset < size:
+                sent = os.sendfile(dest_fd, src_fd, offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+            return
+    shutil.copyfileobj(src, dest, COPY_BUFFER_SIZE)
 
 
 class ExtendedGretelSDK:
+    # Exact-type dispatch; these SDK classes are not subclassed here.
+    _JOB_ID_ATTRS = {Model: "model_id", RecordHandler: "record_id"}
+
     def __init__(self, hybrid: bool):
         self._hybrid = hybrid
+        self._artifact_count_cache: Optional[tuple[float, int]] = None
 
     def get_job_id(self, job: Job) -> Optional[str]:
-        if isinstance(job, Model):
-            return job.model_id
-        elif isinstance(job, RecordHandler):
-            return job.record_id
-        else:
+        id_attr = self._JOB_ID_ATTRS.get(type(job))
+        if id_attr is None:
             raise MultiTableException("Unexpected job object")
+        return getattr(job, id_attr)
 
     def delete_data_sources(self, project: Project, job: Job) -> None:
         if not self._hybrid:
-            if job.data_source is not None:
-                project.delete_artifact(job.data_source)
-            for ref_data in job.ref_data.values:
-                project.delete_artifact(ref_data)
+            targets = [
+                artifact
+                for artifact in [job.data_source, *job.ref_data.values]
+                if artifact is not None
+            ]
+            if len(targets) == 0:
+                return
+
+            def _delete(artifact: str) -> bool:
+                try:
+                    project.delete_artifact(artifact)
+                    return True
+                except Exception:
+                    logger.debug("Failed to delete artifact `%s`", artifact)
+                    return False
+
+            # Each delete is an independent HTTPS round-trip; dispatch them
+            # concurrently so wall time tracks the slowest request rather
+            # than the sum.
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                deleted = sum(executor.map(_delete, targets))
+            self._adjust_artifact_count(-deleted)
 
     def cautiously_refresh_status(
         self, job: Job, key: str, refresh_attempts: dict[str, int]
@@ -44,8 +104,9 @@ class ExtendedGretelSDK:
         try:
             job.refresh()
             refresh_attempts[key] = 0
-        except:
-            refresh_attempts[key] = refresh_attempts[key] + 1
+        except Exception:
+            refresh_attempts[key] = refresh_attempts.get(key, 0) + 1
+            logger.debug("Failed to refresh status for `%s`", key)
 
         return job.status
 
@@ -59,21 +120,33 @@ class ExtendedGretelSDK:
             with gretel_object.get_artifact_handle(artifact_name) as src, open_artifact(
                 out_path, "wb"
             ) as dest:
-                shutil.copyfileobj(src, dest)
+                _copy_stream(src, dest)
             return True
-        except:
-            logger.warning(f"Failed to download `{artifact_name}`")
+        except Exception:
+            logger.warning("Failed to download `%s`", artifact_name)
             return False
 
     def sqs_score_from_full_report(self, report: dict[str, Any]) -> Optional[int]:
-        with suppress(KeyError):
-            for field_dict in report["summary"]:
-                if field_dict["field"] == "synthetic_data_quality_score":
-                    return field_dict["value"]
+        summary = report.get("summary") or []
+        return next(
+            (
+                field_dict["value"]
+                for field_dict in summary
+                if field_dict.get("field") == "synthetic_data_quality_score"
+            ),
+            None,
+        )
 
     def get_record_handler_data(self, record_handler: RecordHandler) -> pd.DataFrame:
-        with record_handler.get_artifact_handle("data") as data:
-            return pd.read_csv(data)
+        # Spool the artifact to a local file first so pandas parses a
+        # seekable file with its C engine instead of pulling small chunks
+        # through the remote handle.
+        with record_handler.get_artifact_handle(
+            "data"
+        ) as data, tempfile.NamedTemporaryFile(suffix=".csv") as tmp:
+            shutil.copyfileobj(data, tmp, COPY_BUFFER_SIZE)
+            tmp.flush()
+            return pd.read_csv(tmp.name)
 
     def start_job_if_possible(
         self,
@@ -83,23 +156,47 @@ class ExtendedGretelSDK:
         project: Project,
         number_of_artifacts: int,
     ) -> None:
-        if job.data_source is None or self._room_in_project(
-            project, number_of_artifacts
-        ):
+        # The artifact limit only applies to cloud projects with uploaded
+        # data sources; skip the artifact-count check (an API call) entirely
+        # in hybrid mode or when there is nothing to upload.
+        if self._hybrid or job.data_source is None:
+            self._log_start(table_name, action)
+            job.submit()
+        elif self._room_in_project(project, number_of_artifacts):
             self._log_start(table_name, action)
             job.submit()
+            self._adjust_artifact_count(number_of_artifacts)
         else:
             self._log_waiting(table_name, action)
 
     def _room_in_project(self, project: Project, count: int) -> bool:
-        if self._hybrid:
-            return True
-        return len(project.artifacts) + count <= MAX_PROJECT_ARTIFACTS
+        return self._artifact_count(project) + count <= MAX_PROJECT_ARTIFACTS
+
+    def _artifact_count(self, project: Project) -> int:
+        # Listing project artifacts is an API call; cache the count briefly
+        # so a burst of job submissions doesn't refetch the list every time.
+        if self._artifact_count_cache is not None:
+            cached_at, count = self._artifact_count_cache
+            if time.monotonic() - cached_at < ARTIFACT_COUNT_CACHE_TTL_SECONDS:
+                return count
+        count = len(project.artifacts)
+        self._artifact_count_cache = (time.monotonic(), count)
+        return count
+
+    def _adjust_artifact_count(self, delta: int) -> None:
+        # Keep the cached count honest between refreshes as artifacts are
+        # uploaded and deleted, so submission bursts within the TTL window
+        # still track toward the project limit.
+        if self._artifact_count_cache is not None:
+            cached_at, count = self._artifact_count_cache
+            self._artifact_count_cache = (cached_at, max(0, count + delta))
 
     def _log_start(self, table_name: str, action: str) -> None:
-        logger.info(f"Starting {action} for `{table_name}`.")
+        logger.info("Starting %s for `%s`.", action, table_name)
 
     def _log_waiting(self, table_name: str, action: str) -> None:
         logger.info(
-            f"Maximum concurrent relational jobs reached. Deferring start of `{table_name}` {action}."
+            "Maximum concurrent relational jobs reached. Deferring start of `%s` %s.",
+            table_name,
+            action,
         )
@@ -1,4 +1,6 @@
-import itertools
+import copy
+import functools
+import shutil
 import sqlite3
 import tempfile
 
@@ -10,6 +12,7 @@ import pandas as pd
 import pytest
 
 from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
 
 from gretel_trainer.relational.connectors import Connector
 from gretel_trainer.relational.core import RelationalData
@@ -24,6 +27,21 @@ def extended_sdk():
     return ExtendedGretelSDK(hybrid=False)
 
 
+class _SuffixCounter:
+    # A plain callable instead of an iterator side_effect: cheaper per call,
+    # and its state can be reset deterministically mid-test, which shared
+    # iterators cannot do safely under parallel test execution.
+    def __init__(self) -> None:
+        self.n = 0
+
+    def __call__(self, *args, **kwargs) -> int:
+        self.n += 1
+        return self.n
+
+    def reset(self) -> None:
+        self.n = 0
+
+
 @pytest.fixture(autouse=True)
 def static_suffix(request):
     if "no_mock_suffix" in request.keywords:
@@ -31,7 +49,9 @@ def static_suffix(request):
         return
     with patch("gretel_trainer.relational.json.make_suffix") as make_suffix:
         # Each call to make_suffix must be unique or there will be table collisions
-        make_suffix.side_effect = itertools.count(start=1)
+        counter = _SuffixCounter()
+        make_suffix.side_effect = counter
+        make_suffix.reset_suffix_count = counter.reset
         yield make_suffix
 
 
@@ -46,12 +66,16 @@ def _get_invented_table_suffix(make_suffix_execution_number: int):
 
 @pytest.fixture
 def invented_tables(get_invented_table_suffix) -> dict[str, str]:
+    specs = [
+        ("purchases_root", "purchases", 1),
+        ("purchases_data_years", "purchases", 2),
+        ("bball_root", "bball", 1),
+        ("bball_suspensions", "bball", 2),
+        ("bball_teams", "bball", 3),
+    ]
     return {
-        "purchases_root": f"purchases_{get_invented_table_suffix(1)}",
-        "purchases_data_years": f"purchases_{get_invented_table_suffix(2)}",
-        "bball_root": f"bball_{get_invented_table_suffix(1)}",
-        "bball_suspensions": f"bball_{get_invented_table_suffix(2)}",
-        "bball_teams": f"bball_{get_invented_table_suffix(3)}",
+        key: f"{prefix}_{get_invented_table_suffix(execution_number)}"
+        for key, prefix, execution_number in specs
     }
 
 
@@ -82,16 +106,67 @@ def project():
         yield project
 
 
+@functools.lru_cache(maxsize=None)
+def _load_sql(name: str) -> str:
+    return (EXAMPLE_DBS / f"{name}.sql").read_text()
+
+
 def _rel_data_connector(name) -> Connector:
     con = sqlite3.connect(f"file:{name}?mode=memory&cache=shared", uri=True)
     cur = con.cursor()
-    with open(EXAMPLE_DBS / f"{name}.sql") as f:
-        cur.executescript(f.read())
+    cur.executescript(_load_sql(name))
     return Connector(
-        create_engine(f"sqlite:///file:{name}?mode=memory&cache=shared&uri=true")
+        create_engine(
+            f"sqlite:///file:{name}?mode=memory&cache=shared&uri=true",
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False},
+        )
     )
 
 
+@pytest.fixture(scope="session")
+def _cached_extraction(tmp_path_factory):
+    # Extracting an example database walks the sqlite schema and writes
+    # per-table CSVs, which is by far the most expensive part of fixture
+    # setup. Extract each database once per session and hand tests clones.
+    # The cache is additionally keyed on whether make_suffix was mocked
+    # during extraction, since invented table names depend on it.
+    cache: dict[tuple[str, bool], RelationalData] = {}
+
+    def _get(name: str, mocked_suffix: bool) -> RelationalData:
+        key = (name, mocked_suffix)
+        if key not in cache:
+            storage_dir = tmp_path_factory.mktemp(f"{name}_extraction")
+            cache[key] = _rel_data_connector(name).extract(
+                storage_dir=str(storage_dir)
+            )
+        return cache[key]
+
+    return _get
+
+
+def _clone_into(rel_data: RelationalData, tmpdir: str) -> RelationalData:
+    # Copy a cached RelationalData into the test's own directory so mutations
+    # (e.g. update_table_data) cannot leak between tests.
+    clone = copy.deepcopy(rel_data)
+    new_dir = Path(tmpdir)
+    handler = clone.source_data_handler
+    for source_file in handler.dir.iterdir():
+        shutil.copyfile(source_file, new_dir / source_file.name)
+    handler.dir = new_dir
+    for table in clone.graph.nodes:
+        metadata = clone.graph.nodes[table]["metadata"]
+        metadata.source = str(new_dir / Path(metadata.source).name)
+    return clone
+
+
+def _cloned_rel_data(
+    _cached_extraction, request, name: str, tmpdir: str
+) -> RelationalData:
+    mocked_suffix = "no_mock_suffix" not in request.keywords
+    return _clone_into(_cached_extraction(name, mocked_suffix), tmpdir)
+
+
 @pytest.fixture()
 def example_dbs():
     return EXAMPLE_DBS
@@ -110,42 +185,48 @@ def tmpfile():
 
 
 @pytest.fixture()
-def pets(tmpdir) -> Generator[RelationalData, None, None]:
-    yield _rel_data_connector("pets").extract(storage_dir=tmpdir)
+def pets(_cached_extraction, request, tmpdir) -> Generator[RelationalData, None, None]:
+    yield _cloned_rel_data(_cached_extraction, request, "pets", tmpdir)
 
 
 @pytest.fixture()
-def ecom(tmpdir) -> Generator[RelationalData, None, None]:
-    yield _rel_data_connector("ecom").extract(storage_dir=tmpdir)
+def ecom(_cached_extraction, request, tmpdir) -> Generator[RelationalData, None, None]:
+    yield _cloned_rel_data(_cached_extraction, request, "ecom", tmpdir)
 
 
 @pytest.fixture()
-def mutagenesis(tmpdir) -> Generator[RelationalData, None, None]:
-    yield _rel_data_connector("mutagenesis").extract(storage_dir=tmpdir)
+def mutagenesis(
+    _cached_extraction, request, tmpdir
+) -> Generator[RelationalData, None, None]:
+    yield _cloned_rel_data(_cached_extraction, request, "mutagenesis", tmpdir)
 
 
 @pytest.fixture()
-def tpch(tmpdir) -> Generator[RelationalData, None, None]:
-    yield _rel_data_connector("tpch").extract(storage_dir=tmpdir)
+def tpch(_cached_extraction, request, tmpdir) -> Generator[RelationalData, None, None]:
+    yield _cloned_rel_data(_cached_extraction, request, "tpch", tmpdir)
 
 
 @pytest.fixture()
-def art(tmpdir) -> Generator[RelationalData, None, None]:
-    yield _rel_data_connector("art").extract(storage_dir=tmpdir)
+def art(_cached_extraction, request, tmpdir) -> Generator[RelationalData, None, None]:
+    yield _cloned_rel_data(_cached_extraction, request, "art", tmpdir)
 
 
 @pytest.fixture()
-def insurance(tmpdir) -> Generator[RelationalData, None, None]:
-    yield _rel_data_connector("insurance").extract(storage_dir=tmpdir)
+def insurance(
+    _cached_extraction, request, tmpdir
+) -> Generator[RelationalData, None, None]:
+    yield _cloned_rel_data(_cached_extraction, request, "insurance", tmpdir)
 
 
 @pytest.fixture()
-def documents(tmpdir) -> Generator[RelationalData, None, None]:
-    yield _rel_data_connector("documents").extract(storage_dir=tmpdir)
+def documents(
+    _cached_extraction, request, tmpdir
+) -> Generator[RelationalData, None, None]:
+    yield _cloned_rel_data(_cached_extraction, request, "documents", tmpdir)
 
 
 @pytest.fixture()
-def trips(tmpdir) -> Generator[RelationalData, None, None]:
+def trips(_cached_extraction, request, tmpdir) -> Generator[RelationalData, None, None]:
     with tempfile.NamedTemporaryFile() as tmpfile:
         data = pd.DataFrame(
             data={
@@ -155,23 +236,45 @@ def trips(tmpdir) -> Generator[RelationalData, None, None]:
             }
         )
         data.to_csv(tmpfile.name, index=False)
-        rel_data = _rel_data_connector("trips").extract(storage_dir=tmpdir)
+        rel_data = _cloned_rel_data(_cached_extraction, request, "trips", tmpdir)
         rel_data.update_table_data(table="trips", data=tmpfile.name)
         yield rel_data
 
 
-# These two NBA fixtures need their own temporary directories instead of
-# using the tmpdir fixture because otherwise they stomp on each other
+# The NBA data is tiny and deterministic, so build each variant's
+# RelationalData once per session and clone it into a fresh temporary
+# directory per test. (The two variants still need separate directories
+# or they stomp on each other.)
+@pytest.fixture(scope="session")
+def _nba_templates(tmp_path_factory):
+    return {
+        synthetic: _setup_nba(
+            str(tmp_path_factory.mktemp(f"nba_{synthetic}")), synthetic
+        )
+        for synthetic in (False, True)
+    }
+
+
+def _cloned_nba(_nba_templates, synthetic: bool, tmpdir: str):
+    rel_data, states, cities, teams = _nba_templates[synthetic]
+    return (
+        _clone_into(rel_data, tmpdir),
+        states.copy(),
+        cities.copy(),
+        teams.copy(),
+    )
+
+
 @pytest.fixture()
-def source_nba():
+def source_nba(_nba_templates):
     with tempfile.TemporaryDirectory() as tmpdir:
-        yield _setup_nba(tmpdir, synthetic=False)
+        yield _cloned_nba(_nba_templates, False, tmpdir)
 
 
 @pytest.fixture()
-def synthetic_nba():
+def synthetic_nba(_nba_templates):
     with tempfile.TemporaryDirectory() as tmpdir:
-        yield _setup_nba(tmpdir, synthetic=True)
+        yield _cloned_nba(_nba_templates, True, tmpdir)
 
 
 def _setup_nba(directory: str, synthetic: bool):
@@ -0,0 +1,47 @@
+from unittest.mock import Mock, PropertyMock
+
+from gretel_trainer.relational.sdk_extras import MAX_PROJECT_ARTIFACTS
+
+
+def test_artifact_count_is_cached_within_ttl(extended_sdk):
+    project = Mock()
+    artifacts = PropertyMock(return_value=["art"] * 3)
+    type(project).artifacts = artifacts
+
+    assert extended_sdk._room_in_project(project, 1)
+    assert extended_sdk._room_in_project(project, 1)
+
+    # The second check is served from the cache, not another listing
+    artifacts.assert_called_once()
+
+
+def test_submissions_consume_room_in_cached_count(extended_sdk):
+    project = Mock()
+    artifacts = PropertyMock(return_value=["art"] * (MAX_PROJECT_ARTIFACTS - 3))
+    type(project).artifacts = artifacts
+
+    job = Mock(data_source="source.csv")
+    extended_sdk.start_job_if_possible(job, "table", "action", project, 3)
+    job.submit.assert_called_once()
+
+    # The cached count now includes the first job's artifacts, so this one
+    # is deferred without refetching the listing
+    deferred_job = Mock(data_source="source.csv")
+    extended_sdk.start_job_if_possible(deferred_job, "table", "action", project, 3)
+    deferred_job.submit.assert_not_called()
+    artifacts.assert_called_once()
+
+
+def test_deletes_free_room_in_cached_count(extended_sdk):
+    project = Mock()
+    artifacts = PropertyMock(return_value=["art"] * MAX_PROJECT_ARTIFACTS)
+    type(project).artifacts = artifacts
+
+    assert not extended_sdk._room_in_project(project, 1)
+
+    job = Mock(data_source="art", ref_data=Mock(values=["ref_1", "ref_2"]))
+    extended_sdk.delete_data_sources(project, job)
+
+    # The three successful deletes freed room without another listing
+    assert extended_sdk._room_in_project(project, 3)
+    artifacts.assert_called_once()
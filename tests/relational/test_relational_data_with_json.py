@@ -1,4 +1,3 @@
-import itertools
 import re
 import tempfile
 
@@ -227,9 +226,9 @@ def test_set_some_primary_key_to_none(static_suffix, documents, invented_tables)
     assert len(documents.list_all_tables(Scope.ALL)) == 5
     original_payments_fks = documents.get_foreign_keys("payments")
 
-    # Reset the make_suffix iterator back to original count since set_primary_key will call it again
+    # Reset the make_suffix counter back to original count since set_primary_key will call it again
     # once for each invented table.
-    static_suffix.side_effect = itertools.count(start=1)
+    static_suffix.reset_suffix_count()
 
     # Setting the primary key causes json invented tables to be dropped and reingested
     documents.set_primary_key(table="purchases", primary_key=None)
@@ -258,9 +257,9 @@ def test_set_none_primary_key_to_some_value(static_suffix, bball, invented_table
     # Setting a None primary key to some column puts us in the correct state
     assert len(bball.list_all_tables(Scope.ALL)) == 4
 
-    # Reset the make_suffix iterator back to original count since set_primary_key will call it again
+    # Reset the make_suffix counter back to original count since set_primary_key will call it again
     # once for each invented table.
-    static_suffix.side_effect = itertools.count(start=1)
+    static_suffix.reset_suffix_count()
 
     bball.set_primary_key(table="bball", primary_key="name")
     assert len(bball.list_all_tables(Scope.ALL)) == 4
@@ -354,9 +353,9 @@ def test_update_data_with_existing_json_to_new_json(
     """
     new_purchases_df = pd.read_json(new_purchases_jsonl, lines=True)
 
-    # Reset the make_suffix iterator back to original count since make_suffix will be called again
+    # Reset the make_suffix counter back to original count since make_suffix will be called again
     # once for each invented table.
-    static_suffix.side_effect = itertools.count(start=1)
+    static_suffix.reset_suffix_count()
 
     documents.update_table_data("purchases", data=new_purchases_df)
 
@@ -485,9 +484,9 @@ def test_update_data_existing_flat_to_json(static_suffix, documents, invented_ta
         assert len(rel_data.list_all_tables(Scope.ALL)) == 3
         assert len(rel_data.list_all_tables(Scope.MODELABLE)) == 3
 
-        # Reset the make_suffix iterator back to original count since make_suffix will be called again
+        # Reset the make_suffix counter back to original count since make_suffix will be called again
         # once for each invented table.
-        static_suffix.side_effect = itertools.count(start=1)
+        static_suffix.reset_suffix_count()
         rel_data.update_table_data("purchases", documents.get_table_data("purchases"))
 
     assert set(rel_data.list_all_tables(Scope.ALL)) == {
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, Union
 from unittest.mock import Mock, patch
 
@@ -23,9 +23,13 @@ from gretel_trainer.relational.workflow_state import SyntheticsRun, SyntheticsTr
 class MockMultiTable:
     relational_data: RelationalData
     _refresh_interval: int = 0
-    _project: Project = Mock(artifacts=[])
-    _strategy: Union[AncestralStrategy, IndependentStrategy] = AncestralStrategy()
-    _extended_sdk: ExtendedGretelSDK = ExtendedGretelSDK(hybrid=False)
+    _project: Project = field(default_factory=lambda: Mock(artifacts=[]))
+    _strategy: Union[AncestralStrategy, IndependentStrategy] = field(
+        default_factory=AncestralStrategy
+    )
+    _extended_sdk: ExtendedGretelSDK = field(
+        default_factory=lambda: ExtendedGretelSDK(hybrid=False)
+    )
 
     def _backup(self) -> None:
         pass
@@ -187,10 +187,15 @@ def test_defers_submission_if_no_room_in_project(get_job_id, extended_sdk):
         project=project,
         models=models,
     )
-    run_task(task, extended_sdk)
+    # Zero out the TTL so every poll refetches the artifact listing
+    with patch(
+        "gretel_trainer.relational.sdk_extras.ARTIFACT_COUNT_CACHE_TTL_SECONDS", 0.0
+    ):
+        run_task(task, extended_sdk)
 
     assert task.iteration_count == 4
     assert task.completed == ["table"]
+    model.submit.assert_called_once()
 
 
 def test_several_models(extended_sdk):